@@ -9,6 +9,7 @@ from .frame_selector import FrameSelector
 from .frame_saver import FrameSaver
 from .tui_processor import TUIProcessor
 from .gps_extractor import GPSData, extract_gps_from_video, parse_iso6709
+from .video_probe import probe_videos_parallel
 from .exif_writer import embed_gps_in_jpeg
 
 __all__ = [
@@ -21,5 +22,6 @@ __all__ = [
     'GPSData',                    # GPS metadata
     'extract_gps_from_video',
     'parse_iso6709',
+    'probe_videos_parallel',      # Batch metadata scan
     'embed_gps_in_jpeg',
 ] 
\ No newline at end of file
@@ -4,12 +4,18 @@ This module handles detection of video color spaces (especially iPhone HDR/wide
 and generates appropriate FFmpeg filter chains to convert to sRGB/BT.709.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
-from enum import Enum
-import subprocess
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Iterable, List
+from enum import IntEnum
+import functools
 import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from .video_probe import probe_video, run_quiet
 
 
 __all__ = [
@@ -18,6 +24,7 @@ __all__ = [
     'TransferFunction',
     'ColorMatrix',
     'detect_color_space',
+    'detect_color_space_many',
     'parse_color_info_from_stream',
     'build_colorspace_filter',
     'get_color_info_description',
@@ -25,86 +32,197 @@ __all__ = [
 ]
 
 
-class ColorPrimaries(Enum):
-    """Video color primaries (ITU-T H.273)."""
-    BT709 = "bt709"           # sRGB/Rec.709
-    BT2020 = "bt2020"         # Wide gamut (HDR)
-    DISPLAY_P3 = "smpte432"   # Display P3 (Apple)
-    UNKNOWN = "unknown"
+class ColorPrimaries(IntEnum):
+    """Video color primaries (ITU-T H.273 code points)."""
+    BT709 = 1                 # sRGB/Rec.709
+    UNKNOWN = 2               # Unspecified
+    BT2020 = 9                # Wide gamut (HDR)
+    DISPLAY_P3 = 12           # Display P3 (Apple), ffprobe "smpte432"
+
+
+class TransferFunction(IntEnum):
+    """Transfer characteristics (gamma/EOTF, ITU-T H.273 code points)."""
+    BT709 = 1                 # SDR
+    UNKNOWN = 2               # Unspecified
+    SRGB = 13                 # sRGB, ffprobe "iec61966-2-1"
+    PQ = 16                   # HDR10/Dolby Vision, ffprobe "smpte2084"
+    HLG = 18                  # Hybrid Log-Gamma, ffprobe "arib-std-b67"
+
 
+class ColorMatrix(IntEnum):
+    """Color matrix coefficients (ITU-T H.273 code points)."""
+    BT709 = 1
+    UNKNOWN = 2               # Unspecified
+    BT2020_NCL = 9            # Non-constant luminance, ffprobe "bt2020nc"
+    BT2020_CL = 10            # Constant luminance, ffprobe "bt2020c"
 
-class TransferFunction(Enum):
-    """Transfer characteristics (gamma/EOTF)."""
-    BT709 = "bt709"           # SDR
-    SRGB = "iec61966-2-1"     # sRGB
-    PQ = "smpte2084"          # HDR10/Dolby Vision
-    HLG = "arib-std-b67"      # Hybrid Log-Gamma
-    UNKNOWN = "unknown"
 
+# ffprobe value -> enum lookups, built once at import
+_PRIMARIES_MAP = {
+    'bt709': ColorPrimaries.BT709,
+    'bt2020': ColorPrimaries.BT2020,
+    'smpte432': ColorPrimaries.DISPLAY_P3,
+}
 
-class ColorMatrix(Enum):
-    """Color matrix coefficients."""
-    BT709 = "bt709"
-    BT2020_NCL = "bt2020nc"   # Non-constant luminance
-    BT2020_CL = "bt2020c"     # Constant luminance
-    UNKNOWN = "unknown"
+_TRANSFER_MAP = {
+    'bt709': TransferFunction.BT709,
+    'iec61966-2-1': TransferFunction.SRGB,
+    'smpte2084': TransferFunction.PQ,
+    'arib-std-b67': TransferFunction.HLG,
+}
 
+_MATRIX_MAP = {
+    'bt709': ColorMatrix.BT709,
+    'bt2020nc': ColorMatrix.BT2020_NCL,
+    'bt2020c': ColorMatrix.BT2020_CL,
+}
 
-@dataclass
+
+# Membership sets for HDR detection and the conversion decision
+_HDR_TRANSFERS = frozenset({TransferFunction.PQ, TransferFunction.HLG})
+_SDR_TRANSFERS_OK = frozenset({TransferFunction.BT709, TransferFunction.SRGB, TransferFunction.UNKNOWN})
+_SDR_PRIMARIES_OK = frozenset({ColorPrimaries.BT709, ColorPrimaries.UNKNOWN})
+_WIDE_GAMUT_PRIMARIES = frozenset({ColorPrimaries.DISPLAY_P3, ColorPrimaries.BT2020})
+
+
+# dataclass(slots=True) requires Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class VideoColorInfo:
-    """Detected color space information from video."""
+    """Detected color space information from video.
+
+    The conversion flags are derived once on construction rather than on
+    every access. On Python 3.10+ instances are slotted (no __dict__).
+    """
     color_primaries: ColorPrimaries
     transfer_function: TransferFunction
     color_matrix: ColorMatrix
     is_hdr: bool
     max_luminance: Optional[float] = None
 
+    _needs_conversion: bool = field(init=False, repr=False, compare=False)
+    _is_wide_gamut_sdr: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Convert if not standard BT.709 SDR
+        needs_conversion = (
+            self.is_hdr or
+            self.color_primaries not in _SDR_PRIMARIES_OK or
+            self.transfer_function not in _SDR_TRANSFERS_OK
+        )
+        is_wide_gamut_sdr = (
+            self.color_primaries in _WIDE_GAMUT_PRIMARIES and
+            not self.is_hdr
+        )
+        object.__setattr__(self, '_needs_conversion', needs_conversion)
+        object.__setattr__(self, '_is_wide_gamut_sdr', is_wide_gamut_sdr)
+
     @property
     def needs_conversion(self) -> bool:
         """Check if video needs color space conversion to sRGB/BT.709."""
-        # Convert if not standard BT.709 SDR
-        if self.is_hdr:
-            return True
-        if self.color_primaries not in [ColorPrimaries.BT709, ColorPrimaries.UNKNOWN]:
-            return True
-        if self.transfer_function not in [TransferFunction.BT709, TransferFunction.SRGB, TransferFunction.UNKNOWN]:
-            return True
-        return False
+        return self._needs_conversion
 
     @property
     def is_wide_gamut_sdr(self) -> bool:
         """Check if this is wide gamut SDR (e.g., Display P3 without HDR)."""
-        return (
-            self.color_primaries in [ColorPrimaries.DISPLAY_P3, ColorPrimaries.BT2020] and
-            not self.is_hdr
-        )
+        return self._is_wide_gamut_sdr
 
 
 def check_zscale_available() -> bool:
     """Check if FFmpeg has zscale filter available (requires libzimg)."""
+    return _run_zscale_check() is True
+
+
+def _run_zscale_check() -> Optional[bool]:
+    """Run `ffmpeg -filters` and look for zscale; None if ffmpeg did not succeed."""
     ffmpeg_executable = 'ffmpeg.exe' if os.name == 'nt' else 'ffmpeg'
     try:
-        result = subprocess.run(
-            [ffmpeg_executable, '-filters'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return 'zscale' in result.stdout
+        result = run_quiet([ffmpeg_executable, '-hide_banner', '-filters'])
+        if result.returncode != 0:
+            # e.g. a missing shared library; the filter list is meaningless
+            return None
+        return b'zscale' in result.stdout
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return False
+        return None
+
+
+def _zscale_cache_path() -> str:
+    """Return the path of the on-disk zscale availability cache."""
+    try:
+        from platformdirs import user_cache_dir
+        cache_dir = user_cache_dir('sharp_frames')
+    except ImportError:
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'sharp_frames')
+    return os.path.join(cache_dir, 'zscale.json')
+
+
+def _ffmpeg_fingerprint(ffmpeg_executable: str) -> Optional[List[Any]]:
+    """Identify the ffmpeg binary on PATH by its path, mtime and size."""
+    ffmpeg_path = shutil.which(ffmpeg_executable)
+    if ffmpeg_path is None:
+        return None
+    try:
+        stat = os.stat(ffmpeg_path)
+    except OSError:
+        return None
+    return [ffmpeg_path, stat.st_mtime_ns, stat.st_size]
 
 
-# Cache the zscale availability check
-_zscale_available: Optional[bool] = None
+def _write_zscale_cache(cache_path: str, fingerprint: List[Any], available: bool) -> None:
+    """Atomically write the zscale cache file, ignoring any I/O errors."""
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'ffmpeg': fingerprint, 'zscale': available}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def check_zscale_available_persistent() -> bool:
+    """
+    Check if zscale is available, reusing the result from previous runs.
+
+    The result is stored on disk keyed on the ffmpeg binary's path, mtime and
+    size, so `ffmpeg -filters` only runs again when ffmpeg changes.
+    """
+    ffmpeg_executable = 'ffmpeg.exe' if os.name == 'nt' else 'ffmpeg'
+    fingerprint = _ffmpeg_fingerprint(ffmpeg_executable)
+    if fingerprint is None:
+        return check_zscale_available()
+
+    cache_path = _zscale_cache_path()
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('ffmpeg') == fingerprint:
+            return bool(cached['zscale'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    available = _run_zscale_check()
+    if available is None:
+        # Failed, timed out or didn't start; don't pin the fallback filter on disk
+        return False
+    _write_zscale_cache(cache_path, fingerprint, available)
+    return available
 
 
+@functools.lru_cache(maxsize=1)
 def is_zscale_available() -> bool:
-    """Check if zscale is available (cached)."""
-    global _zscale_available
-    if _zscale_available is None:
-        _zscale_available = check_zscale_available()
-    return _zscale_available
+    """Check if zscale is available (cached in memory and on disk).
+
+    Use is_zscale_available.cache_clear() to force a fresh check.
+    """
+    return check_zscale_available_persistent()
 
 
 def detect_color_space(video_path: str) -> VideoColorInfo:
@@ -117,30 +235,36 @@ def detect_color_space(video_path: str) -> VideoColorInfo:
     Returns:
         VideoColorInfo with detected or assumed defaults
     """
-    ffprobe_executable = 'ffprobe.exe' if os.name == 'nt' else 'ffprobe'
-
-    cmd = [
-        ffprobe_executable, '-v', 'quiet',
-        '-print_format', 'json',
-        '-show_streams', '-select_streams', 'v:0',
-        os.path.normpath(video_path)
-    ]
-
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            return _default_color_info()
-
-        data = json.loads(result.stdout)
-        streams = data.get('streams', [])
+        streams = probe_video(video_path).get('streams', [])
         if not streams:
-            return _default_color_info()
+            return _DEFAULT_COLOR_INFO
 
         stream = streams[0]
         return parse_color_info_from_stream(stream)
 
     except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError, OSError):
-        return _default_color_info()
+        return _DEFAULT_COLOR_INFO
+
+
+def detect_color_space_many(
+    video_paths: Iterable[str],
+    workers: Optional[int] = None
+) -> List[VideoColorInfo]:
+    """
+    Detect the color space of many videos with concurrent ffprobe calls.
+
+    Args:
+        video_paths: Paths to the video files
+        workers: Number of concurrent ffprobe calls (default: CPU count)
+
+    Returns:
+        VideoColorInfo for each path, in input order
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        return list(executor.map(detect_color_space, video_paths))
 
 
 def parse_color_info_from_stream(stream: Dict[str, Any]) -> VideoColorInfo:
@@ -155,31 +279,32 @@ def parse_color_info_from_stream(stream: Dict[str, Any]) -> VideoColorInfo:
     Returns:
         VideoColorInfo with parsed color space information
     """
-    # Extract color metadata
-    color_primaries_str = stream.get('color_primaries', 'unknown')
-    transfer_str = stream.get('color_transfer', 'unknown')
-    color_matrix_str = stream.get('color_space', 'unknown')
-
-    # Map to enums
-    primaries = _map_color_primaries(color_primaries_str)
-    transfer = _map_transfer_function(transfer_str)
-    matrix = _map_color_matrix(color_matrix_str)
+    # Map color metadata to enums (missing or unrecognized -> UNKNOWN)
+    primaries = _PRIMARIES_MAP.get(
+        (stream.get('color_primaries') or '').lower(), ColorPrimaries.UNKNOWN)
+    transfer = _TRANSFER_MAP.get(
+        (stream.get('color_transfer') or '').lower(), TransferFunction.UNKNOWN)
+    matrix = _MATRIX_MAP.get(
+        (stream.get('color_space') or '').lower(), ColorMatrix.UNKNOWN)
 
     # Determine if HDR based on transfer function
-    is_hdr = transfer in [TransferFunction.PQ, TransferFunction.HLG]
+    is_hdr = transfer in _HDR_TRANSFERS
 
     # Try to get max luminance from side data (for HDR content)
     max_luminance = None
-    side_data = stream.get('side_data_list', [])
-    for data in side_data:
-        if data.get('side_data_type') == 'Mastering display metadata':
-            max_lum_str = data.get('max_luminance', '')
-            if '/' in str(max_lum_str):
-                try:
-                    num, denom = str(max_lum_str).split('/')
-                    max_luminance = float(num) / float(denom)
-                except (ValueError, ZeroDivisionError):
-                    pass
+    mastering = next(
+        (data for data in stream.get('side_data_list') or ()
+         if data.get('side_data_type') == 'Mastering display metadata'),
+        None
+    )
+    if mastering is not None:
+        # ffprobe prints AVRationals as "num/den" with integer parts
+        num, sep, denom = str(mastering.get('max_luminance', '')).partition('/')
+        if num:
+            try:
+                max_luminance = int(num) / int(denom) if sep else float(num)
+            except (ValueError, ZeroDivisionError):
+                pass
 
     return VideoColorInfo(
         color_primaries=primaries,
@@ -190,51 +315,15 @@ def parse_color_info_from_stream(stream: Dict[str, Any]) -> VideoColorInfo:
     )
 
 
-def _map_color_primaries(value: str) -> ColorPrimaries:
-    """Map ffprobe color_primaries to enum."""
-    if not value:
-        return ColorPrimaries.UNKNOWN
-    mapping = {
-        'bt709': ColorPrimaries.BT709,
-        'bt2020': ColorPrimaries.BT2020,
-        'smpte432': ColorPrimaries.DISPLAY_P3,
-    }
-    return mapping.get(value.lower(), ColorPrimaries.UNKNOWN)
-
-
-def _map_transfer_function(value: str) -> TransferFunction:
-    """Map ffprobe color_transfer to enum."""
-    if not value:
-        return TransferFunction.UNKNOWN
-    mapping = {
-        'bt709': TransferFunction.BT709,
-        'iec61966-2-1': TransferFunction.SRGB,
-        'smpte2084': TransferFunction.PQ,
-        'arib-std-b67': TransferFunction.HLG,
-    }
-    return mapping.get(value.lower(), TransferFunction.UNKNOWN)
-
-
-def _map_color_matrix(value: str) -> ColorMatrix:
-    """Map ffprobe color_space (matrix) to enum."""
-    if not value:
-        return ColorMatrix.UNKNOWN
-    mapping = {
-        'bt709': ColorMatrix.BT709,
-        'bt2020nc': ColorMatrix.BT2020_NCL,
-        'bt2020c': ColorMatrix.BT2020_CL,
-    }
-    return mapping.get(value.lower(), ColorMatrix.UNKNOWN)
-
-
-def _default_color_info() -> VideoColorInfo:
-    """Return default color info (assume unknown - no conversion)."""
-    return VideoColorInfo(
-        color_primaries=ColorPrimaries.UNKNOWN,
-        transfer_function=TransferFunction.UNKNOWN,
-        color_matrix=ColorMatrix.UNKNOWN,
-        is_hdr=False
-    )
+# Default color info (assume unknown - no conversion). VideoColorInfo is
+# frozen, so every failed or empty probe can share this one instance.
+_DEFAULT_COLOR_INFO = VideoColorInfo(
+    color_primaries=ColorPrimaries.UNKNOWN,
+    transfer_function=TransferFunction.UNKNOWN,
+    color_matrix=ColorMatrix.UNKNOWN,
+    is_hdr=False
+)
+_default_color_info = _DEFAULT_COLOR_INFO
 
 
 def build_colorspace_filter(color_info: VideoColorInfo) -> Optional[str]:
@@ -250,100 +339,125 @@ def build_colorspace_filter(color_info: VideoColorInfo) -> Optional[str]:
     if not color_info.needs_conversion:
         return None
 
-    if color_info.is_hdr:
-        return _build_hdr_to_sdr_filter(color_info)
-    elif color_info.is_wide_gamut_sdr:
-        return _build_wide_gamut_to_srgb_filter(color_info)
-    else:
+    # Only the HDR path depends on zscale, so SDR input never probes ffmpeg
+    zscale_available = is_zscale_available() if color_info.is_hdr else False
+    return _build_colorspace_filter_cached(color_info, zscale_available)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_colorspace_filter_cached(color_info: VideoColorInfo, zscale_available: bool) -> Optional[str]:
+    """Build the filter string once per distinct color profile and zscale state."""
+    if not color_info.is_hdr and not color_info.is_wide_gamut_sdr:
         return None
+    return _FILTER_DISPATCH[(color_info.is_hdr, zscale_available)](color_info)
+
+
+# Input parameter names for the FFmpeg filters. HDR input defaults to PQ and
+# BT.2020, wide gamut SDR input falls back to BT.709 primaries.
+_HDR_TRANSFER_IN = {
+    TransferFunction.PQ: "smpte2084",
+    TransferFunction.HLG: "arib-std-b67",
+}
+_HDR_PRIMARIES_IN = {
+    ColorPrimaries.BT2020: "bt2020",
+    ColorPrimaries.DISPLAY_P3: "smpte432",
+}
+_SDR_PRIMARIES_IN = {
+    ColorPrimaries.DISPLAY_P3: "smpte432",
+    ColorPrimaries.BT2020: "bt2020",
+}
+
+
+def _zscale_tonemap_filter(transfer_in: str, matrix_in: str, primaries_in: str) -> str:
+    """Full HDR to SDR pipeline with tone mapping, with explicit input parameters."""
+    return (
+        f"zscale=tin={transfer_in}:min={matrix_in}:pin={primaries_in}:"
+        f"t=linear:npl=100,"                # Linearize with input specs
+        "format=gbrpf32le,"                  # High precision intermediate
+        "zscale=p=bt709,"                    # Convert primaries to BT.709
+        "tonemap=hable:desat=0,"             # Hable tone mapping (filmic)
+        "zscale=t=bt709:m=bt709:r=tv,"       # Apply BT.709 transfer/matrix
+        "format=yuv420p"                     # Standard output format
+    )
 
 
-def _build_hdr_to_sdr_filter(color_info: VideoColorInfo) -> str:
-    """
-    Build HDR to SDR tone mapping filter.
+def _colorspace_filter(primaries_in: str) -> str:
+    """Gamut conversion to BT.709 with the colorspace filter (no tone mapping)."""
+    return f"colorspace=all=bt709:iall={primaries_in}:fast=0"
 
-    Uses zscale for high-quality conversion if available,
-    otherwise falls back to basic colorspace filter.
-    """
-    # Determine input transfer function for zscale
-    if color_info.transfer_function == TransferFunction.PQ:
-        transfer_in = "smpte2084"
-    elif color_info.transfer_function == TransferFunction.HLG:
-        transfer_in = "arib-std-b67"
-    else:
-        transfer_in = "smpte2084"  # Default to PQ for unknown HDR
 
-    # Determine input primaries
-    if color_info.color_primaries == ColorPrimaries.BT2020:
-        primaries_in = "bt2020"
-    elif color_info.color_primaries == ColorPrimaries.DISPLAY_P3:
-        primaries_in = "smpte432"
-    else:
-        primaries_in = "bt2020"  # Default to BT.2020 for HDR
+def _build_hdr_to_sdr_filter(color_info: VideoColorInfo) -> str:
+    """Build HDR to SDR tone mapping filter using zscale."""
+    return _zscale_tonemap_filter(
+        _HDR_TRANSFER_IN.get(color_info.transfer_function, "smpte2084"),
+        "bt2020nc",  # BT.2020 non-constant luminance for all HDR input
+        _HDR_PRIMARIES_IN.get(color_info.color_primaries, "bt2020"),
+    )
 
-    # Determine input matrix
-    if color_info.color_matrix in [ColorMatrix.BT2020_NCL, ColorMatrix.BT2020_CL]:
-        matrix_in = "bt2020nc"
-    else:
-        matrix_in = "bt2020nc"  # Default for HDR
-
-    if is_zscale_available():
-        # Full HDR to SDR pipeline with tone mapping
-        # Explicitly specify input parameters for reliable conversion
-        filter_chain = (
-            f"zscale=tin={transfer_in}:min={matrix_in}:pin={primaries_in}:"
-            f"t=linear:npl=100,"                # Linearize with input specs
-            "format=gbrpf32le,"                  # High precision intermediate
-            "zscale=p=bt709,"                    # Convert primaries to BT.709
-            "tonemap=hable:desat=0,"             # Hable tone mapping (filmic)
-            "zscale=t=bt709:m=bt709:r=tv,"       # Apply BT.709 transfer/matrix
-            "format=yuv420p"                     # Standard output format
-        )
-    else:
-        # Fallback: basic colorspace conversion (won't tone map properly)
-        # This is better than nothing but may clip highlights
-        filter_chain = f"colorspace=all=bt709:iall={primaries_in}:fast=0"
 
-    return filter_chain
+def _build_hdr_fallback_filter(color_info: VideoColorInfo) -> str:
+    """
+    Build HDR conversion without zscale.
+
+    Basic colorspace conversion won't tone map properly and may clip
+    highlights, but it is better than nothing.
+    """
+    return _colorspace_filter(_HDR_PRIMARIES_IN.get(color_info.color_primaries, "bt2020"))
 
 
 def _build_wide_gamut_to_srgb_filter(color_info: VideoColorInfo) -> str:
     """
     Build wide gamut SDR (Display P3/BT.2020) to sRGB/BT.709 filter.
     """
-    # Determine input color space for the filter
-    if color_info.color_primaries == ColorPrimaries.DISPLAY_P3:
-        input_primaries = "smpte432"
-    elif color_info.color_primaries == ColorPrimaries.BT2020:
-        input_primaries = "bt2020"
-    else:
-        input_primaries = "bt709"  # Assume BT.709 if unknown
+    return _colorspace_filter(_SDR_PRIMARIES_IN.get(color_info.color_primaries, "bt709"))
 
-    # Use colorspace filter for gamut conversion (no tone mapping needed)
-    filter_chain = f"colorspace=all=bt709:iall={input_primaries}:fast=0"
 
-    return filter_chain
+# (is_hdr, zscale_available) -> filter builder
+_FILTER_DISPATCH = {
+    (True, True): _build_hdr_to_sdr_filter,
+    (True, False): _build_hdr_fallback_filter,
+    (False, True): _build_wide_gamut_to_srgb_filter,
+    (False, False): _build_wide_gamut_to_srgb_filter,
+}
 
 
-def get_color_info_description(color_info: VideoColorInfo) -> str:
-    """Get a human-readable description of the color space."""
+def _describe(primaries: ColorPrimaries, transfer: TransferFunction, is_hdr: bool) -> str:
+    """Build the description for one (primaries, transfer, is_hdr) combination."""
     parts = []
 
-    if color_info.is_hdr:
-        if color_info.transfer_function == TransferFunction.PQ:
+    if is_hdr:
+        if transfer == TransferFunction.PQ:
             parts.append("HDR10/Dolby Vision (PQ)")
-        elif color_info.transfer_function == TransferFunction.HLG:
+        elif transfer == TransferFunction.HLG:
             parts.append("HLG HDR")
         else:
             parts.append("HDR")
     else:
         parts.append("SDR")
 
-    if color_info.color_primaries == ColorPrimaries.DISPLAY_P3:
+    if primaries == ColorPrimaries.DISPLAY_P3:
         parts.append("Display P3")
-    elif color_info.color_primaries == ColorPrimaries.BT2020:
+    elif primaries == ColorPrimaries.BT2020:
         parts.append("BT.2020")
-    elif color_info.color_primaries == ColorPrimaries.BT709:
+    elif primaries == ColorPrimaries.BT709:
         parts.append("BT.709")
 
     return " / ".join(parts) if parts else "Unknown"
+
+
+# Every possible description, built once at import
+_DESCRIPTIONS = {
+    (primaries, transfer, is_hdr): _describe(primaries, transfer, is_hdr)
+    for primaries in ColorPrimaries
+    for transfer in TransferFunction
+    for is_hdr in (False, True)
+}
+
+
+def get_color_info_description(color_info: VideoColorInfo) -> str:
+    """Get a human-readable description of the color space."""
+    key = (color_info.color_primaries, color_info.transfer_function, color_info.is_hdr)
+    description = _DESCRIPTIONS.get(key)
+    if description is None:
+        description = _describe(*key)
+    return description
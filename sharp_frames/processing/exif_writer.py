@@ -4,39 +4,53 @@ This module handles embedding GPS coordinates into JPEG EXIF metadata
 using the piexif library.
 """
 
-import os
-from typing import Tuple
+from typing import Any, Dict
 
-import piexif
-
-from .gps_extractor import GPSData
+from .gps_extractor import GPSData, decimal_to_dms
 
 
 __all__ = ['embed_gps_in_jpeg', 'decimal_to_dms']
 
 
-def decimal_to_dms(decimal_degrees: float) -> Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]:
-    """
-    Convert decimal degrees to degrees/minutes/seconds as EXIF rational tuples.
+# piexif is imported on first use so that importing the processing package
+# does not pay for it when GPS embedding is never needed
+_piexif = None
 
-    EXIF stores coordinates as rationals: ((degrees, 1), (minutes, 1), (seconds*100, 100))
 
-    Args:
-        decimal_degrees: Coordinate in decimal degrees (absolute value)
+def _get_piexif():
+    """Return the piexif module, importing it on first use."""
+    global _piexif
+    if _piexif is None:
+        import piexif
+        _piexif = piexif
+    return _piexif
 
-    Returns:
-        Tuple of three rational tuples: ((deg, 1), (min, 1), (sec*100, 100))
-    """
-    decimal_degrees = abs(decimal_degrees)
-    degrees = int(decimal_degrees)
-    minutes_float = (decimal_degrees - degrees) * 60
-    minutes = int(minutes_float)
-    seconds = (minutes_float - minutes) * 60
 
-    # Store seconds with 2 decimal places precision
-    seconds_rational = (int(seconds * 100), 100)
+def _build_gps_ifd(gps: GPSData) -> Dict[int, Any]:
+    """Build the EXIF GPS IFD for the given coordinates."""
+    piexif = _get_piexif()
+    gps_ifd = {}
+
+    # Latitude
+    lat_ref = "N" if gps.latitude >= 0 else "S"
+    gps_ifd[piexif.GPSIFD.GPSLatitudeRef] = lat_ref.encode('ascii')
+    gps_ifd[piexif.GPSIFD.GPSLatitude] = gps.lat_dms
+
+    # Longitude
+    lon_ref = "E" if gps.longitude >= 0 else "W"
+    gps_ifd[piexif.GPSIFD.GPSLongitudeRef] = lon_ref.encode('ascii')
+    gps_ifd[piexif.GPSIFD.GPSLongitude] = gps.lon_dms
+
+    # Altitude (stored in centimeters for precision)
+    alt_ref = 0 if gps.altitude >= 0 else 1  # 0 = above sea level, 1 = below
+    gps_ifd[piexif.GPSIFD.GPSAltitudeRef] = alt_ref
+    gps_ifd[piexif.GPSIFD.GPSAltitude] = gps.alt_rational
 
-    return ((degrees, 1), (minutes, 1), seconds_rational)
+    # Horizontal positioning error (accuracy in centimeters) if available
+    if gps.accuracy_rational is not None:
+        gps_ifd[piexif.GPSIFD.GPSHPositioningError] = gps.accuracy_rational
+
+    return gps_ifd
 
 
 def embed_gps_in_jpeg(jpeg_path: str, gps: GPSData) -> bool:
@@ -50,45 +64,18 @@ def embed_gps_in_jpeg(jpeg_path: str, gps: GPSData) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    if not os.path.exists(jpeg_path):
-        return False
+    piexif = _get_piexif()
 
     try:
-        # Try to load existing EXIF data
+        # Try to load existing EXIF data (also fails fast if the file is missing)
         try:
             exif_dict = piexif.load(jpeg_path)
         except piexif.InvalidImageDataError:
             # No EXIF data, create empty structure
             exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
 
-        # Build GPS IFD
-        gps_ifd = {}
-
-        # Latitude
-        lat_ref = "N" if gps.latitude >= 0 else "S"
-        gps_ifd[piexif.GPSIFD.GPSLatitudeRef] = lat_ref.encode('ascii')
-        gps_ifd[piexif.GPSIFD.GPSLatitude] = decimal_to_dms(gps.latitude)
-
-        # Longitude
-        lon_ref = "E" if gps.longitude >= 0 else "W"
-        gps_ifd[piexif.GPSIFD.GPSLongitudeRef] = lon_ref.encode('ascii')
-        gps_ifd[piexif.GPSIFD.GPSLongitude] = decimal_to_dms(gps.longitude)
-
-        # Altitude
-        alt_ref = 0 if gps.altitude >= 0 else 1  # 0 = above sea level, 1 = below
-        gps_ifd[piexif.GPSIFD.GPSAltitudeRef] = alt_ref
-        # Store altitude in centimeters for precision
-        alt_rational = (int(abs(gps.altitude) * 100), 100)
-        gps_ifd[piexif.GPSIFD.GPSAltitude] = alt_rational
-
-        # Horizontal positioning error (accuracy) if available
-        if gps.accuracy is not None:
-            # Store accuracy in centimeters
-            accuracy_rational = (int(gps.accuracy * 100), 100)
-            gps_ifd[piexif.GPSIFD.GPSHPositioningError] = accuracy_rational
-
         # Update EXIF dict
-        exif_dict["GPS"] = gps_ifd
+        exif_dict["GPS"] = _build_gps_ifd(gps)
 
         # Generate and insert EXIF bytes
         exif_bytes = piexif.dump(exif_dict)
@@ -6,6 +6,7 @@ import os
 import tempfile
 import subprocess
 import shutil
+from dataclasses import replace
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 
@@ -301,9 +302,18 @@ class FrameExtractor:
             # Use proper executable name based on platform
             ffprobe_executable = 'ffprobe.exe' if os.name == 'nt' else 'ffprobe'
             
+            # Only request what duration, GPS and color detection read,
+            # for the first video stream only
             cmd = [
                 ffprobe_executable, '-v', 'quiet', '-print_format', 'json',
-                '-show_format', '-show_streams', os.path.normpath(video_path)
+                '-select_streams', 'v:0',
+                '-show_entries',
+                'format=duration'
+                ':format_tags=com.apple.quicktime.location.ISO6709,'
+                'com.apple.quicktime.location.accuracy.horizontal'
+                ':stream=color_primaries,color_transfer,color_space'
+                ':stream_side_data=side_data_type,max_luminance',
+                os.path.normpath(video_path)
             ]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             
@@ -343,8 +353,9 @@ class FrameExtractor:
                     accuracy_str = tags.get('com.apple.quicktime.location.accuracy.horizontal')
                     if accuracy_str:
                         try:
-                            gps.accuracy = float(accuracy_str)
-                        except ValueError:
+                            gps = replace(gps, accuracy=float(accuracy_str))
+                        except (ValueError, OverflowError):
+                            # Not a number, or inf/nan (no EXIF rational)
                             pass
                     return gps
 
@@ -354,21 +365,15 @@ class FrameExtractor:
 
     def _extract_color_info_from_video_info(self, video_info: Dict[str, Any]) -> 'VideoColorInfo':
         """Extract color space info from existing video_info (avoids extra ffprobe call)."""
-        from .colorspace import parse_color_info_from_stream, VideoColorInfo, ColorPrimaries, TransferFunction, ColorMatrix
+        from .colorspace import parse_color_info_from_stream, _DEFAULT_COLOR_INFO
 
+        # ffprobe was limited to the first video stream (-select_streams v:0)
         streams = video_info.get('streams', [])
-        # Find the first video stream
-        for stream in streams:
-            if stream.get('codec_type') == 'video':
-                return parse_color_info_from_stream(stream)
+        if streams:
+            return parse_color_info_from_stream(streams[0])
 
         # No video stream found, return default
-        return VideoColorInfo(
-            color_primaries=ColorPrimaries.UNKNOWN,
-            transfer_function=TransferFunction.UNKNOWN,
-            color_matrix=ColorMatrix.UNKNOWN,
-            is_hdr=False
-        )
+        return _DEFAULT_COLOR_INFO
     
     def _run_ffmpeg_extraction(self, video_path: str, output_dir: str, fps: int,
                               output_format: str, width: int, duration: Optional[float] = None,
@@ -8,21 +8,80 @@ import json
 import os
 import re
 import subprocess
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, Tuple
+
+from .video_probe import probe_video, run_quiet
 
 
 __all__ = ['GPSData', 'extract_gps_from_video', 'parse_iso6709']
 
 
-@dataclass
+# Containers that can carry Apple QuickTime location metadata
+_QUICKTIME_EXTENSIONS = frozenset({'.mov', '.mp4', '.m4v'})
+
+_LOCATION_TAGS = (
+    'com.apple.quicktime.location.ISO6709',
+    'com.apple.quicktime.location.accuracy.horizontal',
+)
+
+# ISO 6709 pattern: ±DD.DDDD±DDD.DDDD±AAA.AAA/
+# Latitude: ±DD.DDDD (2 digits before decimal)
+# Longitude: ±DDD.DDDD (3 digits before decimal)
+# Altitude: ±AAA.AAA (optional)
+_ISO6709_RE = re.compile(r'^([+-]\d+\.\d+)([+-]\d+\.\d+)([+-]\d+\.?\d*)?/?$')
+
+
+Rational = Tuple[int, int]
+DMS = Tuple[Rational, Rational, Rational]
+
+
+def decimal_to_dms(decimal_degrees: float) -> DMS:
+    """
+    Convert decimal degrees to degrees/minutes/seconds as EXIF rational tuples.
+
+    EXIF stores coordinates as rationals: ((degrees, 1), (minutes, 1), (seconds*100, 100))
+
+    Args:
+        decimal_degrees: Coordinate in decimal degrees (absolute value)
+
+    Returns:
+        Tuple of three rational tuples: ((deg, 1), (min, 1), (sec*100, 100))
+    """
+    # Work in hundredths of an arc-second so the split is exact integer math
+    total_centiseconds = int(round(abs(decimal_degrees) * 360000))
+    degrees, remainder = divmod(total_centiseconds, 360000)
+    minutes, centiseconds = divmod(remainder, 6000)
+
+    return ((degrees, 1), (minutes, 1), (centiseconds, 100))
+
+
+@dataclass(frozen=True)
 class GPSData:
-    """GPS coordinate data extracted from video metadata."""
+    """GPS coordinate data extracted from video metadata.
+
+    The EXIF rational forms of each value are computed once on construction,
+    so embedding the same coordinates into many frames does no repeated math.
+    """
     latitude: float       # Positive = North, Negative = South
     longitude: float      # Positive = East, Negative = West
     altitude: float       # Meters above sea level
     accuracy: Optional[float] = None  # Horizontal accuracy in meters
 
+    lat_dms: DMS = field(init=False, repr=False, compare=False)
+    lon_dms: DMS = field(init=False, repr=False, compare=False)
+    alt_rational: Rational = field(init=False, repr=False, compare=False)  # Centimeters
+    accuracy_rational: Optional[Rational] = field(init=False, repr=False, compare=False)  # Centimeters
+
+    def __post_init__(self):
+        object.__setattr__(self, 'lat_dms', decimal_to_dms(self.latitude))
+        object.__setattr__(self, 'lon_dms', decimal_to_dms(self.longitude))
+        object.__setattr__(self, 'alt_rational', (int(abs(self.altitude) * 100), 100))
+        object.__setattr__(
+            self, 'accuracy_rational',
+            (int(self.accuracy * 100), 100) if self.accuracy is not None else None
+        )
+
 
 def parse_iso6709(location_string: str) -> Optional[GPSData]:
     """
@@ -42,12 +101,7 @@ def parse_iso6709(location_string: str) -> Optional[GPSData]:
     if not location_string:
         return None
 
-    # ISO 6709 pattern: ±DD.DDDD±DDD.DDDD±AAA.AAA/
-    # Latitude: ±DD.DDDD (2 digits before decimal)
-    # Longitude: ±DDD.DDDD (3 digits before decimal)
-    # Altitude: ±AAA.AAA (optional)
-    pattern = r'^([+-]\d+\.\d+)([+-]\d+\.\d+)([+-]\d+\.?\d*)?/?$'
-    match = re.match(pattern, location_string.strip())
+    match = _ISO6709_RE.match(location_string.strip())
 
     if not match:
         return None
@@ -62,11 +116,41 @@ def parse_iso6709(location_string: str) -> Optional[GPSData]:
             longitude=longitude,
             altitude=altitude
         )
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
+        # OverflowError: digits too long for a finite float
         return None
 
 
-def extract_gps_from_video(video_path: str) -> Optional[GPSData]:
+def _probe_location_tags(video_path: str) -> Dict[str, str]:
+    """
+    Read only the Apple location tags with ffprobe's plain key=value output.
+
+    Raises:
+        subprocess.TimeoutExpired, FileNotFoundError, OSError
+    """
+    ffprobe_executable = 'ffprobe.exe' if os.name == 'nt' else 'ffprobe'
+
+    cmd = [
+        ffprobe_executable, '-v', 'quiet',
+        '-print_format', 'default=noprint_wrappers=1',
+        '-show_entries', 'format_tags=' + ','.join(_LOCATION_TAGS),
+        os.path.normpath(video_path)
+    ]
+
+    result = run_quiet(cmd, text=True)
+    if result.returncode != 0:
+        return {}
+
+    # Lines look like "TAG:com.apple.quicktime.location.ISO6709=+50.8019+012.9069/"
+    tags = {}
+    for line in result.stdout.splitlines():
+        key, sep, value = line.partition('=')
+        if sep:
+            tags[key[4:] if key.startswith('TAG:') else key] = value.strip()
+    return tags
+
+
+def extract_gps_from_video(video_path: str, use_probe_cache: bool = True) -> Optional[GPSData]:
     """
     Extract GPS coordinates from video metadata using ffprobe.
 
@@ -74,26 +158,22 @@ def extract_gps_from_video(video_path: str) -> Optional[GPSData]:
 
     Args:
         video_path: Path to the video file
+        use_probe_cache: Read the tags from the shared, cached ffprobe output
+            (also used by color space detection). If False, run a minimal
+            ffprobe call that returns only the location tags.
 
     Returns:
         GPSData if GPS metadata found, None otherwise
     """
-    ffprobe_executable = 'ffprobe.exe' if os.name == 'nt' else 'ffprobe'
-
-    cmd = [
-        ffprobe_executable, '-v', 'quiet',
-        '-print_format', 'json',
-        '-show_format',
-        os.path.normpath(video_path)
-    ]
+    # Other containers never have the QuickTime location tag; skip ffprobe
+    if os.path.splitext(video_path)[1].lower() not in _QUICKTIME_EXTENSIONS:
+        return None
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            return None
-
-        data = json.loads(result.stdout)
-        tags = data.get('format', {}).get('tags', {})
+        if use_probe_cache:
+            tags = probe_video(video_path).get('format', {}).get('tags', {})
+        else:
+            tags = _probe_location_tags(video_path)
 
         # Try Apple QuickTime location format
         location_str = tags.get('com.apple.quicktime.location.ISO6709')
@@ -104,8 +184,9 @@ def extract_gps_from_video(video_path: str) -> Optional[GPSData]:
                 accuracy_str = tags.get('com.apple.quicktime.location.accuracy.horizontal')
                 if accuracy_str:
                     try:
-                        gps.accuracy = float(accuracy_str)
-                    except ValueError:
+                        gps = replace(gps, accuracy=float(accuracy_str))
+                    except (ValueError, OverflowError):
+                        # Not a number, or inf/nan (no EXIF rational)
                         pass
                 return gps
 
@@ -0,0 +1,170 @@
+"""Shared ffprobe metadata lookup for video files.
+
+GPS extraction and color space detection both need ffprobe output for the
+same video. This module runs ffprobe once per video and memoizes the parsed
+JSON so both consumers share a single subprocess call.
+"""
+
+import functools
+import json
+import os
+import shutil
+import subprocess
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .colorspace import VideoColorInfo
+    from .gps_extractor import GPSData
+
+try:
+    # Optional: faster JSON parsing, reads ffprobe's bytes output directly
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+__all__ = ['probe_video', 'probe_videos_parallel', 'clear_probe_cache']
+
+
+# Only the fields read by detect_color_space and extract_gps_from_video
+_SHOW_ENTRIES = ':'.join([
+    'stream=color_primaries,color_transfer,color_space',
+    'stream_side_data=side_data_type,max_luminance',
+    'format_tags=com.apple.quicktime.location.ISO6709,'
+    'com.apple.quicktime.location.accuracy.horizontal',
+])
+
+
+def probe_video(video_path: str) -> Dict[str, Any]:
+    """
+    Run ffprobe on a video and return its parsed JSON output (cached).
+
+    The result is trimmed to the color fields of the first video stream
+    (including mastering display side data) and the Apple location tags of
+    the container. Results are cached per (path, mtime, size), so a file that
+    changes on disk is probed again. Callers must treat the returned dict as
+    read-only since it is shared between all lookups of the same file.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        Parsed ffprobe output, or an empty dict if ffprobe reported an error
+        (not cached, so the next lookup runs ffprobe again)
+
+    Raises:
+        subprocess.TimeoutExpired, FileNotFoundError, OSError,
+        json.JSONDecodeError: Propagated so failures are not cached.
+    """
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        stat = None
+
+    try:
+        if stat is None:
+            # Nothing to key on; let ffprobe report the problem uncached
+            return _run_ffprobe(video_path)
+        return _probe_video_cached(video_path, stat.st_mtime_ns, stat.st_size)
+    except _ProbeError:
+        return {}
+
+
+class _ProbeError(Exception):
+    """ffprobe exited non-zero; raised so lru_cache does not keep the result."""
+
+
+def clear_probe_cache() -> None:
+    """Forget all cached ffprobe results."""
+    _probe_video_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_video_cached(video_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Cached ffprobe call; mtime_ns and size only serve as part of the key."""
+    return _run_ffprobe(video_path)
+
+
+def run_quiet(cmd: List[str], text: bool = False, timeout: float = 10) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg/ffprobe command, capturing only its stdout.
+
+    stdin and stderr go to DEVNULL and a non-zero exit is left to the caller.
+    The executable is resolved to a full path: CPython only spawns with
+    posix_spawn() (instead of fork/exec) when the executable has a directory
+    component and close_fds is False. Python's own fds are non-inheritable,
+    so close_fds=False leaks nothing.
+
+    Raises:
+        subprocess.TimeoutExpired, FileNotFoundError, OSError
+    """
+    return subprocess.run(
+        [_resolve_executable(cmd[0])] + list(cmd[1:]),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+        text=text,
+        check=False,
+        timeout=timeout
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Full path of an executable on PATH, or the bare name if not found."""
+    return shutil.which(name) or name
+
+
+def _run_ffprobe(video_path: str) -> Dict[str, Any]:
+    """Run ffprobe and parse its JSON output; raises _ProbeError on a non-zero exit."""
+    ffprobe_executable = 'ffprobe.exe' if os.name == 'nt' else 'ffprobe'
+
+    cmd = [
+        ffprobe_executable, '-v', 'quiet',
+        '-print_format', 'json=compact=1',
+        '-select_streams', 'v:0',
+        '-show_entries', _SHOW_ENTRIES,
+        os.path.normpath(video_path)
+    ]
+
+    result = run_quiet(cmd)
+    if result.returncode != 0:
+        raise _ProbeError(f"ffprobe exited with {result.returncode}")
+
+    # Both parsers accept bytes, so the pipe is never decoded separately.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    return _json_loads(result.stdout)
+
+
+def probe_videos_parallel(
+    video_paths: Iterable[str],
+    max_workers: Optional[int] = None
+) -> Dict[str, Tuple['VideoColorInfo', Optional['GPSData']]]:
+    """
+    Detect color space and GPS data for many videos concurrently.
+
+    Each video costs one ffprobe process (shared by both lookups), and the
+    processes run in parallel on a thread pool.
+
+    Args:
+        video_paths: Paths to the video files
+        max_workers: Number of concurrent ffprobe calls (default: CPU count)
+
+    Returns:
+        Dict mapping each path to its (VideoColorInfo, GPSData or None)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from .colorspace import detect_color_space
+    from .gps_extractor import extract_gps_from_video
+
+    def scan(video_path: str) -> Tuple['VideoColorInfo', Optional['GPSData']]:
+        return detect_color_space(video_path), extract_gps_from_video(video_path)
+
+    paths = list(dict.fromkeys(video_paths))
+    if not paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        return dict(zip(paths, executor.map(scan, paths)))
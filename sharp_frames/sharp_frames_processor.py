@@ -451,19 +451,14 @@ class SharpFrames:
 
     def _extract_color_info_from_video_info(self, video_info: Dict[str, Any]):
         """Extract color space info from existing video_info (avoids extra ffprobe call)."""
-        from .processing.colorspace import parse_color_info_from_stream, VideoColorInfo, ColorPrimaries, TransferFunction, ColorMatrix
+        from .processing.colorspace import parse_color_info_from_stream, _DEFAULT_COLOR_INFO
 
         streams = video_info.get('streams', [])
         if streams:
             return parse_color_info_from_stream(streams[0])
 
         # No stream found, return default
-        return VideoColorInfo(
-            color_primaries=ColorPrimaries.UNKNOWN,
-            transfer_function=TransferFunction.UNKNOWN,
-            color_matrix=ColorMatrix.UNKNOWN,
-            is_hdr=False
-        )
+        return _DEFAULT_COLOR_INFO
     
     def _extract_frames(self, duration: float = None, color_info=None) -> bool:
         """Extract frames from video using FFmpeg with color space conversion."""
@@ -1,5 +1,7 @@
 """Tests for the colorspace detection and conversion module."""
 
+import os
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -9,12 +11,37 @@ from sharp_frames.processing.colorspace import (
     TransferFunction,
     ColorMatrix,
     detect_color_space,
+    detect_color_space_many,
     parse_color_info_from_stream,
     build_colorspace_filter,
     get_color_info_description,
     is_zscale_available,
     _default_color_info,
 )
+from sharp_frames.processing.video_probe import clear_probe_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_probe_cache():
+    """Ensure mocked ffprobe output is not served from a previous test's cache."""
+    clear_probe_cache()
+    yield
+    clear_probe_cache()
+
+
+@pytest.fixture(scope='module')
+def mock_run_result():
+    """Factory for subprocess.run results, reusing one mock per (returncode, stdout)."""
+    cache = {}
+
+    def make(returncode, stdout):
+        key = (returncode, stdout)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = MagicMock(returncode=returncode, stdout=stdout)
+        return result
+
+    return make
 
 
 class TestVideoColorInfo:
@@ -84,106 +111,109 @@ class TestVideoColorInfo:
         )
         assert info.needs_conversion is True
 
+    def test_frozen_and_hashable(self):
+        """VideoColorInfo is immutable and usable as a dict key."""
+        import dataclasses
+        info = VideoColorInfo(
+            color_primaries=ColorPrimaries.DISPLAY_P3,
+            transfer_function=TransferFunction.BT709,
+            color_matrix=ColorMatrix.BT709,
+            is_hdr=False
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.is_hdr = True
+        same = VideoColorInfo(ColorPrimaries.DISPLAY_P3, TransferFunction.BT709, ColorMatrix.BT709, False)
+        assert info == same
+        assert hash(info) == hash(same)
+
 
 class TestParseColorInfoFromStream:
     """Tests for parse_color_info_from_stream function."""
 
-    def test_parse_bt709_stream(self):
-        """Parse BT.709 stream data."""
-        stream = {
-            'color_primaries': 'bt709',
-            'color_transfer': 'bt709',
-            'color_space': 'bt709'
-        }
-        info = parse_color_info_from_stream(stream)
-        assert info.color_primaries == ColorPrimaries.BT709
-        assert info.transfer_function == TransferFunction.BT709
-        assert info.color_matrix == ColorMatrix.BT709
-        assert info.is_hdr is False
-
-    def test_parse_display_p3_stream(self):
-        """Parse Display P3 stream data (iPhone SDR)."""
-        stream = {
-            'color_primaries': 'smpte432',
-            'color_transfer': 'bt709',
-            'color_space': 'bt709'
-        }
-        info = parse_color_info_from_stream(stream)
-        assert info.color_primaries == ColorPrimaries.DISPLAY_P3
-        assert info.is_hdr is False
-
-    def test_parse_hdr10_stream(self):
-        """Parse HDR10 stream data."""
-        stream = {
-            'color_primaries': 'bt2020',
-            'color_transfer': 'smpte2084',
-            'color_space': 'bt2020nc'
-        }
+    @pytest.mark.parametrize('stream, expected', [
+        pytest.param(
+            {'color_primaries': 'bt709', 'color_transfer': 'bt709', 'color_space': 'bt709'},
+            {'color_primaries': ColorPrimaries.BT709, 'transfer_function': TransferFunction.BT709,
+             'color_matrix': ColorMatrix.BT709, 'is_hdr': False},
+            id='bt709',
+        ),
+        pytest.param(
+            {'color_primaries': 'smpte432', 'color_transfer': 'bt709', 'color_space': 'bt709'},
+            {'color_primaries': ColorPrimaries.DISPLAY_P3, 'is_hdr': False},
+            id='display-p3-iphone-sdr',
+        ),
+        pytest.param(
+            {'color_primaries': 'bt2020', 'color_transfer': 'smpte2084', 'color_space': 'bt2020nc'},
+            {'color_primaries': ColorPrimaries.BT2020, 'transfer_function': TransferFunction.PQ,
+             'color_matrix': ColorMatrix.BT2020_NCL, 'is_hdr': True},
+            id='hdr10',
+        ),
+        pytest.param(
+            {'color_primaries': 'bt2020', 'color_transfer': 'arib-std-b67', 'color_space': 'bt2020nc'},
+            {'transfer_function': TransferFunction.HLG, 'is_hdr': True},
+            id='hlg',
+        ),
+        pytest.param(
+            {},
+            {'color_primaries': ColorPrimaries.UNKNOWN, 'transfer_function': TransferFunction.UNKNOWN,
+             'color_matrix': ColorMatrix.UNKNOWN, 'is_hdr': False},
+            id='missing-color-data',
+        ),
+        pytest.param(
+            {'color_primaries': 'bt2020', 'color_transfer': 'smpte2084', 'color_space': 'bt2020nc',
+             'side_data_list': [
+                 {'side_data_type': 'Mastering display metadata', 'max_luminance': '10000000/10000'}
+             ]},
+            {'max_luminance': 1000.0},
+            id='mastering-display-metadata',
+        ),
+    ])
+    def test_parse_stream(self, stream, expected):
+        """Parse ffprobe stream data into VideoColorInfo."""
         info = parse_color_info_from_stream(stream)
-        assert info.color_primaries == ColorPrimaries.BT2020
-        assert info.transfer_function == TransferFunction.PQ
-        assert info.color_matrix == ColorMatrix.BT2020_NCL
-        assert info.is_hdr is True
-
-    def test_parse_hlg_stream(self):
-        """Parse HLG HDR stream data."""
+        for attr, value in expected.items():
+            assert getattr(info, attr) == value, attr
+
+    @pytest.mark.parametrize('value, expected', [
+        ('1000', 1000.0),
+        ('10000000/0', None),
+        ('bogus/10000', None),
+        ('', None),
+    ])
+    def test_parse_max_luminance_edge_cases(self, value, expected):
+        """Plain numbers are accepted; malformed rationals are ignored."""
         stream = {
-            'color_primaries': 'bt2020',
-            'color_transfer': 'arib-std-b67',
-            'color_space': 'bt2020nc'
-        }
-        info = parse_color_info_from_stream(stream)
-        assert info.transfer_function == TransferFunction.HLG
-        assert info.is_hdr is True
-
-    def test_parse_empty_stream(self):
-        """Parse stream with missing color data."""
-        stream = {}
-        info = parse_color_info_from_stream(stream)
-        assert info.color_primaries == ColorPrimaries.UNKNOWN
-        assert info.transfer_function == TransferFunction.UNKNOWN
-        assert info.color_matrix == ColorMatrix.UNKNOWN
-        assert info.is_hdr is False
-
-    def test_parse_stream_with_max_luminance(self):
-        """Parse HDR stream with mastering display metadata."""
-        stream = {
-            'color_primaries': 'bt2020',
-            'color_transfer': 'smpte2084',
-            'color_space': 'bt2020nc',
             'side_data_list': [
-                {
-                    'side_data_type': 'Mastering display metadata',
-                    'max_luminance': '10000000/10000'
-                }
+                {'side_data_type': 'Mastering display metadata', 'max_luminance': value}
             ]
         }
-        info = parse_color_info_from_stream(stream)
-        assert info.max_luminance == 1000.0
+        assert parse_color_info_from_stream(stream).max_luminance == expected
+
+    def test_parse_null_side_data_list(self):
+        """A JSON null side_data_list is treated as empty."""
+        info = parse_color_info_from_stream({'color_transfer': 'smpte2084', 'side_data_list': None})
+        assert info.is_hdr is True
+        assert info.max_luminance is None
 
 
 class TestBuildColorspaceFilter:
     """Tests for build_colorspace_filter function."""
 
-    def test_no_filter_for_bt709(self):
-        """No filter needed for standard BT.709."""
+    @pytest.mark.parametrize('primaries, transfer, matrix', [
+        pytest.param(ColorPrimaries.BT709, TransferFunction.BT709, ColorMatrix.BT709, id='bt709'),
+        pytest.param(ColorPrimaries.UNKNOWN, TransferFunction.UNKNOWN, ColorMatrix.UNKNOWN, id='unknown'),
+    ])
+    @patch('sharp_frames.processing.colorspace.is_zscale_available')
+    def test_no_filter_needed(self, mock_zscale, primaries, transfer, matrix):
+        """No filter for standard BT.709 or unknown color space (safe default)."""
         info = VideoColorInfo(
-            color_primaries=ColorPrimaries.BT709,
-            transfer_function=TransferFunction.BT709,
-            color_matrix=ColorMatrix.BT709,
-            is_hdr=False
-        )
-        assert build_colorspace_filter(info) is None
-
-    def test_no_filter_for_unknown(self):
-        """No filter for unknown color space (safe default)."""
-        info = VideoColorInfo(
-            color_primaries=ColorPrimaries.UNKNOWN,
-            transfer_function=TransferFunction.UNKNOWN,
-            color_matrix=ColorMatrix.UNKNOWN,
+            color_primaries=primaries,
+            transfer_function=transfer,
+            color_matrix=matrix,
             is_hdr=False
         )
         assert build_colorspace_filter(info) is None
+        mock_zscale.assert_not_called()
 
     def test_filter_for_display_p3(self):
         """Filter generated for Display P3."""
@@ -287,70 +317,128 @@ class TestDetectColorSpace:
     """Tests for detect_color_space function with mocked ffprobe."""
 
     @patch('subprocess.run')
-    def test_detect_bt709(self, mock_run):
+    def test_detect_bt709(self, mock_run, mock_run_result):
         """Detect BT.709 from ffprobe output."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout='{"streams": [{"codec_type": "video", "color_primaries": "bt709", "color_transfer": "bt709", "color_space": "bt709"}]}'
-        )
+        mock_run.return_value = mock_run_result(0, '{"streams": [{"color_primaries": "bt709", "color_transfer": "bt709", "color_space": "bt709"}]}')
         info = detect_color_space('/fake/video.mp4')
         assert info.color_primaries == ColorPrimaries.BT709
         assert info.is_hdr is False
 
     @patch('subprocess.run')
-    def test_detect_hdr(self, mock_run):
+    def test_detect_hdr(self, mock_run, mock_run_result):
         """Detect HDR from ffprobe output."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout='{"streams": [{"codec_type": "video", "color_primaries": "bt2020", "color_transfer": "smpte2084", "color_space": "bt2020nc"}]}'
-        )
+        mock_run.return_value = mock_run_result(0, '{"streams": [{"color_primaries": "bt2020", "color_transfer": "smpte2084", "color_space": "bt2020nc"}]}')
         info = detect_color_space('/fake/video.mp4')
         assert info.color_primaries == ColorPrimaries.BT2020
         assert info.transfer_function == TransferFunction.PQ
         assert info.is_hdr is True
 
     @patch('subprocess.run')
-    def test_detect_failure_returns_default(self, mock_run):
+    def test_detect_failure_returns_default(self, mock_run, mock_run_result):
         """Return default color info when ffprobe fails."""
-        mock_run.return_value = MagicMock(returncode=1, stdout='')
+        mock_run.return_value = mock_run_result(1, '')
         info = detect_color_space('/fake/video.mp4')
         assert info.color_primaries == ColorPrimaries.UNKNOWN
         assert info.is_hdr is False
+        assert info is _default_color_info
 
     @patch('subprocess.run')
     def test_detect_timeout_returns_default(self, mock_run):
         """Return default color info on timeout."""
         from subprocess import TimeoutExpired
-        mock_run.side_effect = TimeoutExpired('ffprobe', 30)
+        mock_run.side_effect = TimeoutExpired('ffprobe', 10)
         info = detect_color_space('/fake/video.mp4')
         assert info.color_primaries == ColorPrimaries.UNKNOWN
 
+    @patch('subprocess.run')
+    def test_detect_many_preserves_order(self, mock_run, mock_run_result):
+        """Batch detection returns one result per path in input order."""
+        outputs = {
+            'sdr.mp4': '{"streams": [{"color_primaries": "bt709", "color_transfer": "bt709", "color_space": "bt709"}]}',
+            'hdr.mp4': '{"streams": [{"color_primaries": "bt2020", "color_transfer": "smpte2084", "color_space": "bt2020nc"}]}',
+        }
+        mock_run.side_effect = lambda cmd, **kwargs: mock_run_result(
+            0, outputs[os.path.basename(cmd[-1])]
+        )
+
+        infos = detect_color_space_many(['/fake/hdr.mp4', '/fake/sdr.mp4'], workers=2)
+
+        assert [info.color_primaries for info in infos] == [ColorPrimaries.BT2020, ColorPrimaries.BT709]
+        assert [info.is_hdr for info in infos] == [True, False]
+        assert mock_run.call_count == 2
+
 
 class TestIsZscaleAvailable:
     """Tests for zscale availability check."""
 
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path):
+        """Keep the on-disk zscale cache out of the user's cache directory."""
+        cache_path = str(tmp_path / 'zscale.json')
+        is_zscale_available.cache_clear()
+        with patch('sharp_frames.processing.colorspace._zscale_cache_path', return_value=cache_path):
+            yield cache_path
+        is_zscale_available.cache_clear()
+
     @patch('subprocess.run')
-    def test_zscale_available(self, mock_run):
+    def test_zscale_available(self, mock_run, mock_run_result):
         """Detect zscale when available."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout='... zscale ... other filters ...'
-        )
-        # Clear the cache
-        import sharp_frames.processing.colorspace as cs
-        cs._zscale_available = None
-
+        mock_run.return_value = mock_run_result(0, b'... zscale ... other filters ...')
+        is_zscale_available.cache_clear()
         assert is_zscale_available() is True
 
     @patch('subprocess.run')
-    def test_zscale_not_available(self, mock_run):
+    def test_zscale_not_available(self, mock_run, mock_run_result):
         """Detect when zscale is not available."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout='scale colorspace other_filter'
-        )
-        # Clear the cache
-        import sharp_frames.processing.colorspace as cs
-        cs._zscale_available = None
+        mock_run.return_value = mock_run_result(0, b'scale colorspace other_filter')
+        is_zscale_available.cache_clear()
+        assert is_zscale_available() is False
+
+    @patch('sharp_frames.processing.colorspace._ffmpeg_fingerprint',
+           return_value=['/usr/bin/ffmpeg', 123, 456])
+    @patch('subprocess.run')
+    def test_zscale_result_persisted_on_disk(self, mock_run, mock_fingerprint, isolated_cache, mock_run_result):
+        """A later run reuses the on-disk result for the same ffmpeg binary."""
+        mock_run.return_value = mock_run_result(0, b'... zscale ...')
+        assert is_zscale_available() is True
+
+        is_zscale_available.cache_clear()
+        assert is_zscale_available() is True
+        assert mock_run.call_count == 1
+
+        # A different ffmpeg binary invalidates the cached result
+        mock_fingerprint.return_value = ['/usr/bin/ffmpeg', 789, 456]
+        mock_run.return_value = mock_run_result(0, b'scale colorspace')
+        is_zscale_available.cache_clear()
+        assert is_zscale_available() is False
+        assert mock_run.call_count == 2
+
+    @patch('sharp_frames.processing.colorspace._ffmpeg_fingerprint',
+           return_value=['/usr/bin/ffmpeg', 123, 456])
+    @patch('subprocess.run')
+    def test_zscale_failure_not_persisted(self, mock_run, mock_fingerprint, isolated_cache, mock_run_result):
+        """A timed-out check falls back for this run but is retried on the next."""
+        from subprocess import TimeoutExpired
+        mock_run.side_effect = TimeoutExpired('ffmpeg', 10)
+        assert is_zscale_available() is False
+        assert not os.path.exists(isolated_cache)
 
+        mock_run.side_effect = None
+        mock_run.return_value = mock_run_result(0, b'... zscale ...')
+        is_zscale_available.cache_clear()
+        assert is_zscale_available() is True
+        assert mock_run.call_count == 2
+
+    @patch('sharp_frames.processing.colorspace._ffmpeg_fingerprint',
+           return_value=['/usr/bin/ffmpeg', 123, 456])
+    @patch('subprocess.run')
+    def test_zscale_nonzero_exit_not_persisted(self, mock_run, mock_fingerprint, isolated_cache, mock_run_result):
+        """An ffmpeg run that exits non-zero is not written to the disk cache."""
+        mock_run.return_value = mock_run_result(1, b'')
         assert is_zscale_available() is False
+        assert not os.path.exists(isolated_cache)
+
+        mock_run.return_value = mock_run_result(0, b'... zscale ...')
+        is_zscale_available.cache_clear()
+        assert is_zscale_available() is True
+        assert mock_run.call_count == 2
@@ -0,0 +1,68 @@
+"""Tests for the EXIF GPS writing module."""
+
+import piexif
+import pytest
+from PIL import Image
+
+from sharp_frames.processing.gps_extractor import GPSData
+from sharp_frames.processing.exif_writer import (
+    decimal_to_dms,
+    embed_gps_in_jpeg,
+)
+
+
+@pytest.fixture
+def jpeg_path(tmp_path):
+    """A small JPEG without EXIF data."""
+    path = tmp_path / 'frame.jpg'
+    Image.new('RGB', (16, 16), color=(128, 64, 32)).save(path, 'JPEG')
+    return str(path)
+
+
+@pytest.fixture
+def gps():
+    return GPSData(latitude=50.8019, longitude=-12.9069, altitude=311.398, accuracy=4.5)
+
+
+class TestEmbedGps:
+    """Tests for GPS EXIF embedding."""
+
+    def test_embed_gps(self, jpeg_path, gps):
+        """GPS coordinates are written as EXIF rationals."""
+        assert embed_gps_in_jpeg(jpeg_path, gps) is True
+
+        gps_ifd = piexif.load(jpeg_path)['GPS']
+        assert gps_ifd[piexif.GPSIFD.GPSLatitudeRef] == b'N'
+        assert gps_ifd[piexif.GPSIFD.GPSLongitudeRef] == b'W'
+        assert gps_ifd[piexif.GPSIFD.GPSLatitude][0] == (50, 1)
+        assert gps_ifd[piexif.GPSIFD.GPSHPositioningError] == (450, 100)
+
+    def test_embed_keeps_existing_exif(self, jpeg_path, gps):
+        """Existing EXIF fields are merged, not replaced."""
+        exif_dict = {"0th": {piexif.ImageIFD.Make: b'Apple'}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+        piexif.insert(piexif.dump(exif_dict), jpeg_path)
+
+        assert embed_gps_in_jpeg(jpeg_path, gps) is True
+        exif_dict = piexif.load(jpeg_path)
+        assert exif_dict['0th'][piexif.ImageIFD.Make] == b'Apple'
+        assert exif_dict['GPS'][piexif.GPSIFD.GPSLatitudeRef] == b'N'
+
+    def test_missing_file_returns_false(self, tmp_path, gps):
+        """Embedding into a missing file fails cleanly."""
+        missing = str(tmp_path / 'missing.jpg')
+        assert embed_gps_in_jpeg(missing, gps) is False
+
+
+class TestDecimalToDms:
+    """Tests for decimal_to_dms function."""
+
+    @pytest.mark.parametrize('decimal, expected', [
+        (50.8019, ((50, 1), (48, 1), (684, 100))),
+        (-12.9069, ((12, 1), (54, 1), (2484, 100))),
+        (0.0, ((0, 1), (0, 1), (0, 100))),
+        # Rounding up to a whole degree carries instead of giving 60 seconds
+        (89.99999999, ((90, 1), (0, 1), (0, 100))),
+    ])
+    def test_conversion(self, decimal, expected):
+        """Decimal degrees map to exact EXIF rationals."""
+        assert decimal_to_dms(decimal) == expected
@@ -270,4 +270,78 @@ class TestFrameExtractor:
             assert file_path.endswith('.jpg')
         
         # Should not include non-image files
-        assert str(non_image) not in filtered_files
\ No newline at end of file
+        assert str(non_image) not in filtered_files
+
+# ffprobe output for the trimmed -show_entries request: only the requested
+# keys, no codec_type/index, and only the first video stream
+TRIMMED_PROBE_OUTPUT = (
+    '{"programs": [], '
+    '"streams": [{"color_primaries": "bt2020", "color_transfer": "smpte2084", '
+    '"color_space": "bt2020nc", "side_data_list": [{"side_data_type": '
+    '"Mastering display metadata", "max_luminance": "10000000/10000"}]}], '
+    '"format": {"duration": "12.500000", "tags": {'
+    '"com.apple.quicktime.location.ISO6709": "+50.8019+012.9069+311.398/", '
+    '"com.apple.quicktime.location.accuracy.horizontal": "4.5"}}}'
+)
+
+
+class TestVideoInfoProbe:
+    """Test the FFprobe call behind _get_video_info and its consumers."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.extractor = FrameExtractor()
+
+    @patch('subprocess.run')
+    def test_get_video_info_requests_only_first_stream_entries(self, mock_run):
+        """FFprobe is limited to the first video stream and the needed entries."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=TRIMMED_PROBE_OUTPUT)
+
+        video_info = self.extractor._get_video_info('/fake/video.mov')
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index('-select_streams') + 1] == 'v:0'
+        entries = cmd[cmd.index('-show_entries') + 1].split(':')
+        assert 'format=duration' in entries
+        assert 'stream=color_primaries,color_transfer,color_space' in entries
+        assert 'stream_side_data=side_data_type,max_luminance' in entries
+        assert any(entry.startswith('format_tags=') for entry in entries)
+        assert video_info['format']['duration'] == '12.500000'
+
+    def test_extract_from_trimmed_video_info(self):
+        """Duration, GPS and color info are read from the trimmed JSON shape."""
+        import json
+        from sharp_frames.processing.colorspace import ColorPrimaries, TransferFunction
+
+        video_info = json.loads(TRIMMED_PROBE_OUTPUT)
+
+        assert self.extractor._extract_duration_from_info(video_info) == pytest.approx(12.5)
+
+        gps = self.extractor._extract_gps_from_video_info(video_info)
+        assert gps.latitude == pytest.approx(50.8019)
+        assert gps.longitude == pytest.approx(12.9069)
+        assert gps.accuracy == pytest.approx(4.5)
+
+        color_info = self.extractor._extract_color_info_from_video_info(video_info)
+        assert color_info.color_primaries == ColorPrimaries.BT2020
+        assert color_info.transfer_function == TransferFunction.PQ
+        assert color_info.is_hdr is True
+        assert color_info.max_luminance == 1000.0
+
+    def test_extract_color_info_without_streams(self):
+        """A file without a video stream falls back to the default color info."""
+        from sharp_frames.processing.colorspace import _DEFAULT_COLOR_INFO
+
+        video_info = {'programs': [], 'streams': [], 'format': {'duration': '1.0'}}
+        assert self.extractor._extract_color_info_from_video_info(video_info) is _DEFAULT_COLOR_INFO
+        assert self.extractor._extract_gps_from_video_info(video_info) is None
+
+    def test_non_finite_accuracy_keeps_coordinates(self):
+        """An inf accuracy tag is dropped instead of discarding the GPS data."""
+        video_info = {'format': {'tags': {
+            'com.apple.quicktime.location.ISO6709': '+50.8019+012.9069/',
+            'com.apple.quicktime.location.accuracy.horizontal': 'inf',
+        }}}
+        gps = self.extractor._extract_gps_from_video_info(video_info)
+        assert gps.latitude == pytest.approx(50.8019)
+        assert gps.accuracy is None
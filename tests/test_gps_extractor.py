@@ -0,0 +1,118 @@
+"""Tests for the GPS metadata extraction module."""
+
+import dataclasses
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from sharp_frames.processing.gps_extractor import GPSData, extract_gps_from_video, parse_iso6709
+
+
+class TestParseIso6709:
+    """Tests for parse_iso6709 function."""
+
+    def test_parse_lat_lon_alt(self):
+        """Parse latitude, longitude and altitude."""
+        gps = parse_iso6709('+50.8019+012.9069+311.398/')
+        assert gps.latitude == pytest.approx(50.8019)
+        assert gps.longitude == pytest.approx(12.9069)
+        assert gps.altitude == pytest.approx(311.398)
+
+    def test_parse_lat_lon_only(self):
+        """Altitude defaults to zero when missing."""
+        gps = parse_iso6709('+50.8019+012.9069/')
+        assert gps.latitude == pytest.approx(50.8019)
+        assert gps.longitude == pytest.approx(12.9069)
+        assert gps.altitude == 0.0
+
+    def test_parse_negative_coordinates(self):
+        """Parse south/west coordinates and below-sea-level altitude."""
+        gps = parse_iso6709('-33.8688-151.2093-012.5/')
+        assert gps.latitude == pytest.approx(-33.8688)
+        assert gps.longitude == pytest.approx(-151.2093)
+        assert gps.altitude == pytest.approx(-12.5)
+
+    def test_parse_integer_altitude_without_slash(self):
+        """Altitude may omit the fraction and the trailing slash is optional."""
+        gps = parse_iso6709(' +50.8019-012.9069+311 ')
+        assert gps.longitude == pytest.approx(-12.9069)
+        assert gps.altitude == pytest.approx(311.0)
+
+    @pytest.mark.parametrize('location', [
+        '',
+        '/',
+        '+50.8019/',
+        '50.8019+012.9069/',
+        '+50+012.9069/',
+        '+50.8019+012.9069+/',
+        '+50.8019+012.9069+311.398+1.0/',
+        '+5e1.8019+012.9069/',
+        '+' + '9' * 400 + '.0+012.9069/',
+    ])
+    def test_parse_invalid_returns_none(self, location):
+        """Malformed strings are rejected."""
+        assert parse_iso6709(location) is None
+
+
+class TestGPSData:
+    """Tests for the GPSData dataclass."""
+
+    def test_exif_rationals_precomputed(self):
+        """EXIF rational forms are available without further conversion."""
+        gps = GPSData(latitude=-33.5, longitude=151.25, altitude=-12.5, accuracy=4.5)
+        assert gps.lat_dms == ((33, 1), (30, 1), (0, 100))
+        assert gps.lon_dms == ((151, 1), (15, 1), (0, 100))
+        assert gps.alt_rational == (1250, 100)
+        assert gps.accuracy_rational == (450, 100)
+        assert GPSData(1.0, 2.0, 3.0).accuracy_rational is None
+
+    def test_frozen(self):
+        """GPSData is immutable and compares by coordinates."""
+        gps = GPSData(latitude=1.0, longitude=2.0, altitude=3.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            gps.accuracy = 5.0
+        assert dataclasses.replace(gps, accuracy=5.0) == GPSData(1.0, 2.0, 3.0, accuracy=5.0)
+
+
+class TestExtractGpsFromVideo:
+    """Tests for extract_gps_from_video function."""
+
+    @patch('subprocess.run')
+    def test_non_quicktime_container_skips_ffprobe(self, mock_run):
+        """Containers without QuickTime metadata are not probed."""
+        assert extract_gps_from_video('/fake/video.avi') is None
+        assert extract_gps_from_video('/fake/video.mkv') is None
+        mock_run.assert_not_called()
+
+    @patch('subprocess.run')
+    def test_tag_only_probe_without_cache(self, mock_run):
+        """Without the shared probe cache, only the location tags are requested."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                'TAG:com.apple.quicktime.location.accuracy.horizontal=4.5\n'
+                'TAG:com.apple.quicktime.location.ISO6709=+50.8019+012.9069+311.398/\n'
+            )
+        )
+        gps = extract_gps_from_video('/fake/video.mov', use_probe_cache=False)
+        assert gps.latitude == pytest.approx(50.8019)
+        assert gps.accuracy == pytest.approx(4.5)
+
+        cmd = mock_run.call_args[0][0]
+        assert 'default=noprint_wrappers=1' in cmd
+        assert 'json' not in cmd
+
+    @pytest.mark.parametrize('accuracy', ['inf', 'nan', 'bogus'])
+    @patch('subprocess.run')
+    def test_unusable_accuracy_is_ignored(self, mock_run, accuracy):
+        """Non-numeric or non-finite accuracy keeps the coordinates without it."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                f'TAG:com.apple.quicktime.location.accuracy.horizontal={accuracy}\n'
+                'TAG:com.apple.quicktime.location.ISO6709=+50.8019+012.9069+311.398/\n'
+            )
+        )
+        gps = extract_gps_from_video('/fake/video.mov', use_probe_cache=False)
+        assert gps.latitude == pytest.approx(50.8019)
+        assert gps.accuracy is None
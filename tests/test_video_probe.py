@@ -0,0 +1,176 @@
+"""Tests for the shared ffprobe metadata lookup."""
+
+import json
+import subprocess
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from sharp_frames.processing import video_probe
+from sharp_frames.processing.video_probe import probe_video, probe_videos_parallel, clear_probe_cache, run_quiet
+from sharp_frames.processing.colorspace import detect_color_space, ColorPrimaries
+from sharp_frames.processing.gps_extractor import extract_gps_from_video
+
+
+PROBE_OUTPUT = (
+    '{"streams": [{"color_primaries": "smpte432", '
+    '"color_transfer": "bt709", "color_space": "bt709"}], '
+    '"format": {"tags": {"com.apple.quicktime.location.ISO6709": "+50.8019+012.9069+311.398/", '
+    '"com.apple.quicktime.location.accuracy.horizontal": "4.5"}}}'
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_probe_cache():
+    """Start every test with an empty probe cache."""
+    clear_probe_cache()
+    yield
+    clear_probe_cache()
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    """A real file so probe results can be cached by mtime and size."""
+    path = tmp_path / 'video.mov'
+    path.write_bytes(b'not really a video')
+    return str(path)
+
+
+class TestProbeVideo:
+    """Tests for probe_video and its consumers."""
+
+    @patch('subprocess.run')
+    def test_gps_and_colorspace_share_one_ffprobe_call(self, mock_run, video_file):
+        """Color space and GPS detection reuse the same ffprobe output."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=PROBE_OUTPUT)
+
+        info = detect_color_space(video_file)
+        gps = extract_gps_from_video(video_file)
+
+        assert info.color_primaries == ColorPrimaries.DISPLAY_P3
+        assert gps is not None
+        assert gps.latitude == pytest.approx(50.8019)
+        assert gps.longitude == pytest.approx(12.9069)
+        assert gps.accuracy == pytest.approx(4.5)
+        assert mock_run.call_count == 1
+        assert '-show_entries' in mock_run.call_args[0][0]
+        assert 'json=compact=1' in mock_run.call_args[0][0]
+        assert mock_run.call_args[1]['stdin'] == subprocess.DEVNULL
+        assert mock_run.call_args[1]['stderr'] == subprocess.DEVNULL
+        assert mock_run.call_args[1]['timeout'] == 10
+
+    @patch('subprocess.run')
+    def test_failure_is_not_cached(self, mock_run, video_file):
+        """A timed-out probe is retried on the next lookup."""
+        from subprocess import TimeoutExpired
+        mock_run.side_effect = [
+            TimeoutExpired('ffprobe', 10),
+            MagicMock(returncode=0, stdout=PROBE_OUTPUT),
+        ]
+
+        assert extract_gps_from_video(video_file) is None
+        assert extract_gps_from_video(video_file) is not None
+        assert mock_run.call_count == 2
+
+    @patch('subprocess.run')
+    def test_changed_file_is_probed_again(self, mock_run, video_file):
+        """Modifying the file invalidates its cached probe result."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=PROBE_OUTPUT)
+
+        probe_video(video_file)
+        probe_video(video_file)
+        assert mock_run.call_count == 1
+
+        with open(video_file, 'ab') as f:
+            f.write(b' and now longer')
+        probe_video(video_file)
+        assert mock_run.call_count == 2
+
+    @patch('subprocess.run')
+    def test_missing_file_is_not_cached(self, mock_run):
+        """Paths that cannot be stat'ed are probed every time."""
+        mock_run.return_value = MagicMock(returncode=1, stdout='')
+        probe_video('/fake/video.mov')
+        probe_video('/fake/video.mov')
+        assert mock_run.call_count == 2
+
+    @patch('subprocess.run')
+    def test_ffprobe_error_is_not_cached(self, mock_run, video_file):
+        """A non-zero ffprobe exit is retried on the next lookup."""
+        mock_run.side_effect = [
+            MagicMock(returncode=1, stdout=b''),
+            MagicMock(returncode=0, stdout=PROBE_OUTPUT),
+        ]
+
+        assert probe_video(video_file) == {}
+        assert probe_video(video_file)['streams'][0]['color_primaries'] == 'smpte432'
+        assert mock_run.call_count == 2
+
+    @patch('subprocess.run')
+    def test_ffprobe_error_returns_empty(self, mock_run):
+        """A non-zero ffprobe exit yields an empty result."""
+        mock_run.return_value = MagicMock(returncode=1, stdout='')
+        assert probe_video('/fake/video.mov') == {}
+
+    @pytest.mark.parametrize('loads', [json.loads, video_probe._json_loads])
+    @patch('subprocess.run')
+    def test_parses_bytes_output(self, mock_run, loads):
+        """ffprobe output is parsed from bytes with either JSON backend."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=PROBE_OUTPUT.encode('utf-8'))
+        with patch.object(video_probe, '_json_loads', loads):
+            data = probe_video('/fake/video.mov')
+        assert data['streams'][0]['color_primaries'] == 'smpte432'
+
+
+class TestRunQuiet:
+    """Tests for the shared subprocess helper."""
+
+    @pytest.fixture(autouse=True)
+    def empty_executable_cache(self):
+        video_probe._resolve_executable.cache_clear()
+        yield
+        video_probe._resolve_executable.cache_clear()
+
+    @patch('shutil.which', return_value='/usr/bin/ffprobe')
+    @patch('subprocess.run')
+    def test_resolves_executable_path(self, mock_run, mock_which):
+        """The executable gets a full path so posix_spawn can be used."""
+        run_quiet(['ffprobe', '-version'])
+        run_quiet(['ffprobe', '-version'])
+
+        assert mock_run.call_args[0][0] == ['/usr/bin/ffprobe', '-version']
+        assert mock_run.call_args[1]['close_fds'] is False
+        assert mock_run.call_args[1]['check'] is False
+        assert mock_which.call_count == 1
+
+    @patch('shutil.which', return_value=None)
+    @patch('subprocess.run')
+    def test_unresolved_executable_keeps_bare_name(self, mock_run, mock_which):
+        """A missing executable is left for subprocess to report."""
+        run_quiet(['ffprobe', '-version'])
+        assert mock_run.call_args[0][0] == ['ffprobe', '-version']
+
+
+class TestProbeVideosParallel:
+    """Tests for probe_videos_parallel."""
+
+    @patch('subprocess.run')
+    def test_one_probe_per_video(self, mock_run, tmp_path):
+        """Each video is probed once and results are keyed by path."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=PROBE_OUTPUT)
+        first, second = str(tmp_path / 'a.mov'), str(tmp_path / 'b.mov')
+        for path in (first, second):
+            with open(path, 'wb') as f:
+                f.write(b'video')
+
+        results = probe_videos_parallel([first, second, first], max_workers=2)
+
+        assert list(results) == [first, second]
+        for color_info, gps in results.values():
+            assert color_info.color_primaries == ColorPrimaries.DISPLAY_P3
+            assert gps.latitude == pytest.approx(50.8019)
+        assert mock_run.call_count == 2
+
+    def test_empty_input(self):
+        """No paths means no work."""
+        assert probe_videos_parallel([]) == {}